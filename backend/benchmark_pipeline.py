@@ -0,0 +1,475 @@
+"""
+End-to-end benchmark for the automatic processing pipeline.
+
+Runs start_auto_processing -> download_from_drive -> transcribe_audio ->
+save_transcript_to_supabase -> generate_minutes_of_meeting -> save_mom_to_supabase
+against local stand-ins for Google Drive, AssemblyAI and Supabase, using
+synthetic media of configurable length.
+
+Usage:
+    python benchmark_pipeline.py --meetings 8 --concurrency 4 --media-minutes 30
+    python benchmark_pipeline.py --json results.json
+    python benchmark_pipeline.py --compare results.json --tolerance 0.25
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+API_SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api-server.py')
+
+STAGES = [
+    'download_from_drive',
+    'transcribe_audio',
+    'save_transcript_to_supabase',
+    'generate_minutes_of_meeting',
+    'save_mom_to_supabase',
+]
+
+WORDS = (
+    "we need to review the budget for the next quarter and agree on the release plan "
+    "please send the updated figures to the team before friday so we can finalize "
+    "the customer feedback was positive but the onboarding flow still needs work "
+    "action item schedule a follow up meeting with design and engineering next week"
+).split()
+
+
+def load_api_server():
+    """Import api-server.py as a module (the file name is not importable directly)"""
+    spec = importlib.util.spec_from_file_location('api_server', API_SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['api_server'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_synthetic_media(path, seconds, bitrate_kbps):
+    """Write a media-sized file of random bytes matching the requested duration and bitrate"""
+    size = int(seconds * bitrate_kbps * 1000 / 8)
+    block = os.urandom(1024 * 1024)
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            n = min(remaining, len(block))
+            f.write(block[:n])
+            remaining -= n
+    return size
+
+
+def synthetic_transcript(seconds, speakers=2, words_per_minute=150, utterance_seconds=20):
+    """Build a transcript dict shaped like the AssemblyAI result for the given media length"""
+    utterances = []
+    words_per_utterance = max(1, int(words_per_minute * utterance_seconds / 60))
+    start = 0
+    index = 0
+    while start < seconds * 1000:
+        offset = (index * words_per_utterance) % len(WORDS)
+        text = " ".join(WORDS[(offset + i) % len(WORDS)] for i in range(words_per_utterance))
+        utterances.append({
+            "speaker": chr(ord('A') + index % speakers),
+            "start": start,
+            "end": start + utterance_seconds * 1000,
+            "text": text.capitalize() + ".",
+        })
+        start += utterance_seconds * 1000
+        index += 1
+    return {"text": " ".join(u["text"] for u in utterances), "utterances": utterances}
+
+
+class StandInConfig:
+    """Latency knobs for the local stand-ins (seconds)"""
+    def __init__(self, args):
+        self.drive_bandwidth = args.drive_mbps * 1024 * 1024 / 8 if args.drive_mbps else 0
+        self.transcribe_latency = args.transcribe_latency
+        self.transcribe_rtf = args.transcribe_rtf
+        self.supabase_latency = args.supabase_latency
+        self.bitrate_kbps = args.bitrate_kbps
+        self.speakers = args.speakers
+
+
+class SupabaseStandIn(BaseHTTPRequestHandler):
+    """Minimal PostgREST + AssemblyAI REST emulation backed by in-memory tables"""
+    tables = {}
+    transcripts = {}
+    lock = threading.Lock()
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _reply(self, status, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _table_and_filter(self):
+        parsed = urlparse(self.path)
+        table = parsed.path.rsplit('/', 1)[-1]
+        query = parse_qs(parsed.query)
+        meeting_id = None
+        if 'meeting_id' in query:
+            meeting_id = query['meeting_id'][0].split('eq.', 1)[-1]
+        return table, meeting_id
+
+    def do_GET(self):
+        time.sleep(self.config.supabase_latency)
+        if self.path.startswith('/v2/transcript/'):
+            transcript_id = self.path.rsplit('/', 1)[-1]
+            with self.lock:
+                result = self.transcripts.get(transcript_id)
+            if result is None:
+                return self._reply(404, {'error': 'not found'})
+            return self._reply(200, dict(result, status='completed'))
+        table, meeting_id = self._table_and_filter()
+        with self.lock:
+            rows = list(self.tables.get(table, {}).values())
+        if meeting_id:
+            rows = [r for r in rows if r.get('meeting_id') == meeting_id]
+        self._reply(200, rows)
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.path.startswith('/v2/upload'):
+            seconds = len(body) * 8 / (self.config.bitrate_kbps * 1000)
+            with self.lock:
+                upload_id = str(len(self.transcripts) + 1)
+                self.transcripts[upload_id] = synthetic_transcript(seconds, self.config.speakers)
+            return self._reply(200, {'upload_url': f'local://{upload_id}'})
+        if self.path.startswith('/v2/transcript'):
+            upload_id = json.loads(body).get('audio_url', '').split('//', 1)[-1]
+            return self._reply(200, {'id': upload_id})
+        time.sleep(self.config.supabase_latency)
+        table, _ = self._table_and_filter()
+        row = json.loads(body or b'{}')
+        with self.lock:
+            self.tables.setdefault(table, {}).setdefault(row.get('meeting_id'), {}).update(row)
+        self._reply(201)
+
+    def do_PATCH(self):
+        body = self._read_body()
+        time.sleep(self.config.supabase_latency)
+        table, meeting_id = self._table_and_filter()
+        row = json.loads(body or b'{}')
+        with self.lock:
+            self.tables.setdefault(table, {}).setdefault(meeting_id, {'meeting_id': meeting_id}).update(row)
+        self._reply(204)
+
+
+class FakeDriveService:
+    """Stand-in for the googleapiclient Drive service; file ids map to local paths"""
+    def __init__(self, media_files):
+        self.media_files = media_files
+
+    def files(self):
+        return self
+
+    def get_media(self, fileId):
+        return self.media_files[fileId]
+
+
+class FakeDownloadStatus:
+    def __init__(self, fraction):
+        self.fraction = fraction
+
+    def progress(self):
+        return self.fraction
+
+
+def make_fake_downloader(config):
+    class FakeMediaIoBaseDownload:
+        """Chunked copy from the synthetic media file, throttled to the configured bandwidth"""
+        def __init__(self, fd, source_path, chunksize=100 * 1024 * 1024):
+            self.fd = fd
+            self.source = open(source_path, 'rb')
+            self.total = os.path.getsize(source_path)
+            self.chunksize = chunksize
+            self.done = 0
+
+        def next_chunk(self):
+            data = self.source.read(self.chunksize)
+            self.fd.write(data)
+            self.done += len(data)
+            if config.drive_bandwidth:
+                time.sleep(len(data) / config.drive_bandwidth)
+            finished = self.done >= self.total
+            if finished:
+                self.source.close()
+            return FakeDownloadStatus(self.done / self.total if self.total else 1.0), finished
+
+    return FakeMediaIoBaseDownload
+
+
+def make_fake_transcriber(config):
+    class FakeUtterance:
+        def __init__(self, utt):
+            self.speaker = utt['speaker']
+            self.start = utt['start']
+            self.end = utt['end']
+            self.text = utt['text']
+
+    class FakeTranscript:
+        def __init__(self, result):
+            self.text = result['text']
+            self.utterances = [FakeUtterance(u) for u in result['utterances']]
+
+    class FakeTranscriber:
+        """Simulates AssemblyAI turnaround: fixed latency plus a real-time factor of media length"""
+        def transcribe(self, path, config=None):
+            seconds = os.path.getsize(path) * 8 / (stand_in.bitrate_kbps * 1000)
+            time.sleep(stand_in.transcribe_latency + seconds * stand_in.transcribe_rtf)
+            return FakeTranscript(synthetic_transcript(seconds, stand_in.speakers))
+
+    stand_in = config
+    return FakeTranscriber
+
+
+class ResourceSampler(threading.Thread):
+    """Samples RSS and the size of the uploads folder to record peak usage"""
+    def __init__(self, folder, interval=0.05):
+        super().__init__(daemon=True)
+        self.folder = folder
+        self.interval = interval
+        self.peak_disk = 0
+        self.peak_rss = 0
+        self.stopped = threading.Event()
+
+    def _disk_usage(self):
+        total = 0
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def _rss(self):
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * resource.getpagesize()
+        except OSError:
+            return 0
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak_disk = max(self.peak_disk, self._disk_usage())
+            self.peak_rss = max(self.peak_rss, self._rss())
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def install_stand_ins(api, config, media_files, timings):
+    """Point the api module at the local stand-ins and wrap each stage with a timer"""
+    api.get_authenticated_client = lambda: None
+    api.build = lambda *args, **kwargs: FakeDriveService(media_files)
+    api.MediaIoBaseDownload = make_fake_downloader(config)
+    api.aai.Transcriber = make_fake_transcriber(config)
+
+    timings_lock = threading.Lock()
+
+    def timed(name, func):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with timings_lock:
+                    timings[name].append(time.perf_counter() - started)
+        return wrapper
+
+    for stage in STAGES:
+        setattr(api, stage, timed(stage, getattr(api, stage)))
+
+
+def wait_for_jobs(api, meeting_ids):
+    """Block until every meeting's processing job has completed or failed"""
+    def finished():
+        return all(
+            api.PROCESSING_JOBS.get(m, {}).get('status') in api.PROCESSING_TERMINAL_STATUSES
+            for m in meeting_ids
+        )
+    with api.PROCESSING_JOBS_CONDITION:
+        api.PROCESSING_JOBS_CONDITION.wait_for(finished)
+
+
+def run_benchmark(args):
+    workdir = tempfile.mkdtemp(prefix='pipeline-bench-')
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        api = load_api_server()
+        logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+
+        config = StandInConfig(args)
+        SupabaseStandIn.config = config
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SupabaseStandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        local_url = f"http://127.0.0.1:{server.server_address[1]}"
+        api.SUPABASE_URL = local_url
+
+        # The large-file path talks to the AssemblyAI REST API directly
+        import requests
+        real_request = requests.sessions.Session.request
+
+        def routed_request(self, method, url, *a, **kw):
+            if url.startswith('https://api.assemblyai.com'):
+                url = local_url + url[len('https://api.assemblyai.com'):]
+            return real_request(self, method, url, *a, **kw)
+
+        requests.sessions.Session.request = routed_request
+
+        media_dir = os.path.join(workdir, 'media')
+        os.makedirs(media_dir)
+        media_files = {}
+        media_bytes = 0
+        for i in range(args.meetings):
+            path = os.path.join(media_dir, f'meeting_{i:04d}.mp3')
+            media_bytes += create_synthetic_media(path, args.media_minutes * 60, args.bitrate_kbps)
+            media_files[f'drive-file-{i:04d}'] = path
+
+        timings = {stage: [] for stage in STAGES}
+        install_stand_ins(api, config, media_files, timings)
+        api.PROCESSING_EXECUTOR = ThreadPoolExecutor(max_workers=args.concurrency)
+
+        sampler = ResourceSampler(api.UPLOAD_FOLDER)
+        sampler.start()
+        started = time.perf_counter()
+        meetings = list(enumerate(media_files))
+        for i, drive_file_id in meetings:
+            api.start_auto_processing(f'bench-meeting-{i:04d}', drive_file_id, f'meeting_{i:04d}.mp3')
+        wait_for_jobs(api, [f'bench-meeting-{i:04d}' for i, _ in meetings])
+        wall = time.perf_counter() - started
+        sampler.stop()
+        server.shutdown()
+        requests.sessions.Session.request = real_request
+
+        completed = sum(
+            1 for row in SupabaseStandIn.tables.get('meeting_minutes', {}).values()
+            if row.get('full_mom')
+        )
+        return {
+            'config': {
+                'meetings': args.meetings,
+                'concurrency': args.concurrency,
+                'media_minutes': args.media_minutes,
+                'bitrate_kbps': args.bitrate_kbps,
+                'media_bytes': media_bytes,
+            },
+            'stages': {
+                stage: {
+                    'count': len(values),
+                    'mean': sum(values) / len(values) if values else 0.0,
+                    'p50': percentile(values, 50),
+                    'p95': percentile(values, 95),
+                    'max': max(values) if values else 0.0,
+                }
+                for stage, values in timings.items()
+            },
+            'completed': completed,
+            'wall_seconds': wall,
+            'meetings_per_hour': completed / wall * 3600 if wall else 0.0,
+            'peak_rss_bytes': max(sampler.peak_rss, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024),
+            'peak_disk_bytes': sampler.peak_disk,
+        }
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def print_report(results):
+    cfg = results['config']
+    print(f"\nPipeline benchmark: {cfg['meetings']} meetings x {cfg['media_minutes']} min "
+          f"@ {cfg['bitrate_kbps']} kbps, concurrency {cfg['concurrency']}")
+    print(f"{'stage':<30}{'count':>7}{'mean s':>10}{'p50 s':>10}{'p95 s':>10}{'max s':>10}")
+    for stage, s in results['stages'].items():
+        print(f"{stage:<30}{s['count']:>7}{s['mean']:>10.3f}{s['p50']:>10.3f}{s['p95']:>10.3f}{s['max']:>10.3f}")
+    print(f"\nCompleted:        {results['completed']}/{cfg['meetings']}")
+    print(f"Wall time:        {results['wall_seconds']:.2f} s")
+    print(f"Throughput:       {results['meetings_per_hour']:.1f} meetings/hour")
+    print(f"Peak RSS:         {results['peak_rss_bytes'] / (1024 * 1024):.1f} MB")
+    print(f"Peak disk usage:  {results['peak_disk_bytes'] / (1024 * 1024):.1f} MB")
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """Return a list of regressions (p50 stage latency or throughput) beyond the tolerance"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = []
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if previous and previous['p50'] > 0 and current['p50'] > previous['p50'] * (1 + tolerance):
+            regressions.append(f"{stage}: p50 {previous['p50']:.3f}s -> {current['p50']:.3f}s")
+    previous_throughput = baseline.get('meetings_per_hour', 0)
+    if previous_throughput and results['meetings_per_hour'] < previous_throughput * (1 - tolerance):
+        regressions.append(
+            f"throughput: {previous_throughput:.1f} -> {results['meetings_per_hour']:.1f} meetings/hour")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the automatic processing pipeline')
+    parser.add_argument('--meetings', type=int, default=4, help='number of meetings to process')
+    parser.add_argument('--concurrency', type=int, default=2, help='processing worker pool size')
+    parser.add_argument('--media-minutes', type=float, default=10, help='synthetic media length')
+    parser.add_argument('--bitrate-kbps', type=int, default=64, help='synthetic media bitrate')
+    parser.add_argument('--speakers', type=int, default=2, help='speakers in the synthetic transcript')
+    parser.add_argument('--drive-mbps', type=float, default=0, help='simulated Drive bandwidth (0 = unthrottled)')
+    parser.add_argument('--transcribe-latency', type=float, default=0.5, help='fixed AssemblyAI turnaround (s)')
+    parser.add_argument('--transcribe-rtf', type=float, default=0.0,
+                        help='AssemblyAI processing time as a fraction of media length')
+    parser.add_argument('--supabase-latency', type=float, default=0.02, help='Supabase round trip (s)')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--compare', help='baseline results file to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown vs baseline')
+    parser.add_argument('--verbose', action='store_true', help='show api-server logs')
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.compare:
+        regressions = compare_with_baseline(results, args.compare, args.tolerance)
+        if regressions:
+            print("\nRegressions detected:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
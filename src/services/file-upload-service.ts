@@ -103,10 +103,12 @@ export class FileUploadService {
   /**
    * Get meeting minutes (transcript and MoM) for a meeting
    * @param meetingId - The meeting ID
+   * @param fields - Optional columns to fetch, e.g. ['summary', 'full_mom'] to skip the transcript
    * @returns Promise with meeting minutes
    */
-  async getMeetingMinutes(meetingId: string): Promise<MeetingMinutes | null> {
-    const response = await fetch(`${this.baseUrl}/get-meeting-minutes/${meetingId}`);
+  async getMeetingMinutes(meetingId: string, fields?: string[]): Promise<MeetingMinutes | null> {
+    const query = fields?.length ? `?fields=${encodeURIComponent(fields.join(','))}` : '';
+    const response = await fetch(`${this.baseUrl}/get-meeting-minutes/${meetingId}${query}`);
 
     if (!response.ok) {
       throw new Error(`Failed to get meeting minutes: ${response.statusText}`);
@@ -228,8 +230,8 @@ export const getMeetingVideos = async (meetingId: string) => {
   return fileUploadService.getMeetingFiles(meetingId);
 };
 
-export const getMeetingMinutes = async (meetingId: string) => {
-  return fileUploadService.getMeetingMinutes(meetingId);
+export const getMeetingMinutes = async (meetingId: string, fields?: string[]) => {
+  return fileUploadService.getMeetingMinutes(meetingId, fields);
 };
 
 export const deleteMeetingVideo = async (fileId: string) => {
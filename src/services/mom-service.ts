@@ -66,6 +66,14 @@ export interface MeetingInvitation {
   attendees: EmailRecipient[];
 }
 
+// Polling for queued /transcribe jobs: short server-side waits, exponential backoff, overall cap
+const TRANSCRIBE_POLL_WAIT_SECONDS = 5;
+const TRANSCRIBE_POLL_MIN_DELAY_MS = 1000;
+const TRANSCRIBE_POLL_MAX_DELAY_MS = 10000;
+const TRANSCRIBE_POLL_TIMEOUT_MS = 30 * 60 * 1000;
+// A poll can briefly miss a job (e.g. a worker without the shared job store); retry before failing
+const TRANSCRIBE_POLL_NOT_FOUND_RETRIES = 3;
+
 export class MomService {
   private apiKey: string;
   private baseUrl: string;
@@ -92,7 +100,28 @@ export class MomService {
         throw new Error(`Transcription failed: ${response.statusText}`);
       }
 
-      return await response.json();
+      // The backend queues the transcription and returns a job handle; poll it for the result
+      const { job_id } = await response.json();
+      const deadline = Date.now() + TRANSCRIBE_POLL_TIMEOUT_MS;
+      let delay = TRANSCRIBE_POLL_MIN_DELAY_MS;
+      let notFoundRetries = TRANSCRIBE_POLL_NOT_FOUND_RETRIES;
+      while (true) {
+        const result = await fetch(`${this.baseUrl}/transcribe/${job_id}?wait=${TRANSCRIBE_POLL_WAIT_SECONDS}`);
+        const retryNotFound = result.status === 404 && notFoundRetries-- > 0;
+        if (result.status === 202 || retryNotFound) {
+          if (Date.now() + delay > deadline) {
+            throw new Error('Transcription timed out');
+          }
+          await new Promise(resolve => setTimeout(resolve, delay));
+          delay = Math.min(delay * 2, TRANSCRIBE_POLL_MAX_DELAY_MS);
+          continue;
+        }
+        if (!result.ok) {
+          const body = await result.json().catch(() => ({}));
+          throw new Error(`Transcription failed: ${body.error || result.statusText}`);
+        }
+        return await result.json();
+      }
     } catch (error) {
       console.error('Transcription error:', error);
       return null;